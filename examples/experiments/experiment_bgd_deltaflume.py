@@ -32,6 +32,9 @@ from pydrever.data import (
 from experiment import Experiment
 import numpy as numpy
 
+# Cross-shore positions of the output locations (every meter from 171 to 190 m).
+_OUTPUT_X_POSITIONS = numpy.arange(171.0, 191.0, 1.0).tolist()
+
 
 class BgdDeltaFlumeExperiment(Experiment):
     def get_calculation_input() -> DikernelInput:
@@ -117,7 +120,6 @@ class BgdDeltaFlumeExperiment(Experiment):
         return [wave_impact_settings]
 
     def generate_output_locations() -> list[OutputLocationSpecification]:
-        x_positions = numpy.linspace(171.0, 190.0, 20)
         return [
             OutputLocationSpecification(
                 x_position=x_position,
@@ -125,5 +127,5 @@ class BgdDeltaFlumeExperiment(Experiment):
                     top_layer_type=TopLayerType.GrassClosedSod
                 ),
             )
-            for x_position in x_positions
+            for x_position in _OUTPUT_X_POSITIONS
         ]
@@ -26,6 +26,7 @@ from pydrever.data._dikerneloutputspecification import (
 )
 from pydrever.data._dikernelcalculationsettings import CalculationSettings
 from abc import ABC, abstractmethod
+import math
 import numpy as numpy
 import pydrever.data._data_validation as data_validation
 from pydantic import BaseModel, ConfigDict, root_validator, Field
@@ -38,7 +39,9 @@ class RevetmentZoneDefinition(BaseModel, ABC):
     """ Determines whether the profile coordinates of the DikeSchematization are also returned when calling get_x_coordinates"""
 
     @abstractmethod
-    def get_x_coordinates(self, dike_schematization: DikeSchematization) -> list[float]:
+    def get_x_coordinates(
+        self, dike_schematization: DikeSchematization
+    ) -> numpy.ndarray:
         """
         This method returns the x-locations where calculations should be performed.
 
@@ -46,7 +49,7 @@ class RevetmentZoneDefinition(BaseModel, ABC):
             dike_schematization (DikeSchematization): The dike schematization.
 
         Returns:
-            list[float]: A list of x-locations
+            numpy.ndarray: An array of x-locations (in ascending order)
         """
         return None
 
@@ -68,23 +71,21 @@ class HorizontalRevetmentZoneDefinition(RevetmentZoneDefinition):
         return values
 
     def get_x_coordinates(self, dike_schematizaion: DikeSchematization):
+        x_min = self.x_min
+        x_max = self.x_max
         if self.nx is not None:
             nx = self.nx
         else:
-            nx = numpy.ceil((self.x_max - self.x_min) / self.dx_max).astype(int) + 1
-
-        x_coordinates = numpy.linspace(self.x_min, self.x_max, nx)
-        if self.include_schematization_coordinates and dike_schematizaion is not None:
-            x_coordinates = numpy.union1d(
-                x_coordinates,
-                [
-                    x
-                    for x in dike_schematizaion.x_positions
-                    if x < self.x_max and x > self.x_min
-                ],
-            )
+            nx = math.ceil((x_max - x_min) / self.dx_max) + 1
 
-        return x_coordinates
+        x_coordinates = _get_equidistant_coordinates(x_min, x_max, nx)
+        if not self.include_schematization_coordinates or dike_schematizaion is None:
+            return x_coordinates
+
+        x_dike = numpy.asarray(dike_schematizaion.x_positions, dtype=float)
+        return _merge_coordinates(
+            x_coordinates, x_dike[(x_dike > x_min) & (x_dike < x_max)]
+        )
 
 
 class VerticalRevetmentZoneDefinition(RevetmentZoneDefinition):
@@ -106,36 +107,143 @@ class VerticalRevetmentZoneDefinition(RevetmentZoneDefinition):
     def get_x_coordinates(
         self, dike_schematizaion: DikeSchematization, inner_slope: bool = False
     ):
-        x_coordaintes = numpy.array(dike_schematizaion.x_positions)
-        z_coordaintes = numpy.array(dike_schematizaion.z_positions)
-        filter_mask = (
-            x_coordaintes <= dike_schematizaion.x_outer_crest
-            if not inner_slope
-            else x_coordaintes >= dike_schematizaion.x_outer_crest
-        )
-        x_dike = numpy.array(x_coordaintes[filter_mask])
-        z_dike = numpy.array(z_coordaintes[filter_mask])
-
+        z_min = self.z_min
+        z_max = self.z_max
         if self.nz is not None:
             nz = self.nz
         else:
-            nz = numpy.ceil((self.z_max - self.z_min) / self.dz_max).astype(int) + 1
+            nz = math.ceil((z_max - z_min) / self.dz_max) + 1
 
-        z_output_coordinates = numpy.linspace(self.z_min, self.z_max, nz)
+        return _get_vertical_x_coordinates(
+            x_positions=numpy.asarray(dike_schematizaion.x_positions, dtype=float),
+            z_positions=numpy.asarray(dike_schematizaion.z_positions, dtype=float),
+            x_outer_crest=dike_schematizaion.x_outer_crest,
+            z_min=z_min,
+            z_max=z_max,
+            nz=nz,
+            inner_slope=inner_slope,
+            include_schematization_coordinates=self.include_schematization_coordinates,
+        )
+
+
+def _get_vertical_x_coordinates(
+    x_positions: numpy.ndarray,
+    z_positions: numpy.ndarray,
+    x_outer_crest: float,
+    z_min: float,
+    z_max: float,
+    nz: int,
+    inner_slope: bool,
+    include_schematization_coordinates: bool,
+) -> numpy.ndarray:
+    """
+    Determines the x-coordinates of nz equidistant levels between z_min and z_max on the
+    outer (or inner) slope of the dike profile. This only operates on plain arrays and
+    scalars, so it does not depend on the (pydantic) zone definition.
+
+    Args:
+        x_positions (numpy.ndarray): Ascending cross-shore positions of the dike profile.
+        z_positions (numpy.ndarray): Heights of the dike profile.
+        x_outer_crest (float): Cross-shore position of the outer crest.
+        z_min (float): Lower level of the zone.
+        z_max (float): Upper level of the zone.
+        nz (int): Number of levels.
+        inner_slope (bool): Whether the zone is located on the inner slope.
+        include_schematization_coordinates (bool): Whether to add the profile points
+            within the zone.
+
+    Returns:
+        numpy.ndarray: The x-coordinates in ascending order.
+    """
+    # The cross-shore positions of a dike profile are ascending, so the slope is a slice.
+    if not inner_slope:
+        split_index = numpy.searchsorted(x_positions, x_outer_crest, side="right")
+        x_dike = x_positions[:split_index]
+        z_dike = z_positions[:split_index]
+    else:
+        split_index = numpy.searchsorted(x_positions, x_outer_crest, side="left")
+        x_dike = x_positions[split_index:]
+        z_dike = z_positions[split_index:]
+
+    z_output_coordinates = _get_equidistant_coordinates(z_min, z_max, nz)
+    if not inner_slope:
+        x_output_coordinates = numpy.interp(z_output_coordinates, z_dike, x_dike)
+    else:
+        # The inner slope starts at the end of the crest, so points at the level of the
+        # outer crest are skipped. numpy.interp requires ascending z (the inner slope
+        # descends), so the slope is reversed and so is the result to return ascending
+        # x-coordinates.
+        slope_start = max(int(numpy.argmax(z_dike != z_dike[0])) - 1, 0)
         x_output_coordinates = numpy.interp(
             z_output_coordinates,
-            z_dike,
-            x_dike,
-        )
+            z_dike[slope_start:][::-1],
+            x_dike[slope_start:][::-1],
+        )[::-1]
 
-        if self.include_schematization_coordinates and dike_schematizaion is not None:
-            z_filter = numpy.logical_and(z_dike <= self.z_max, z_dike >= self.z_min)
-            x_output_coordinates = numpy.union1d(
-                x_output_coordinates,
-                x_dike[z_filter],
-            )
+    if not include_schematization_coordinates:
         return x_output_coordinates
 
+    z_filter = numpy.logical_and(z_dike <= z_max, z_dike >= z_min)
+    return _merge_coordinates(x_output_coordinates, x_dike[z_filter])
+
+
+def _get_equidistant_coordinates(start: float, stop: float, n: int) -> numpy.ndarray:
+    """
+    Returns n equidistant coordinates from start to stop (both included). Equivalent to
+    numpy.linspace, but writes directly into a single float64 buffer.
+
+    Args:
+        start (float): The first coordinate.
+        stop (float): The last coordinate.
+        n (int): The number of coordinates.
+
+    Returns:
+        numpy.ndarray: The coordinates.
+    """
+    coordinates = numpy.arange(n, dtype=numpy.float64)
+    if n > 1:
+        coordinates *= (stop - start) / (n - 1)
+        coordinates += start
+        coordinates[-1] = stop
+    else:
+        coordinates[:] = start
+    return coordinates
+
+
+_RELATIVE_COORDINATE_TOLERANCE = 1e-6
+""" Coordinates closer to each other than this fraction of the average coordinate spacing are considered duplicates."""
+
+
+def _merge_coordinates(
+    coordinates: numpy.ndarray, extra_coordinates: numpy.ndarray
+) -> numpy.ndarray:
+    """
+    Merges the extra coordinates into the (ascending) coordinates. Coordinates that
+    (nearly) coincide are only returned once (the first one is kept), since these would
+    only result in an additional calculation at the same location.
+
+    Args:
+        coordinates (numpy.ndarray): Ascending coordinates.
+        extra_coordinates (numpy.ndarray): Coordinates to add.
+
+    Returns:
+        numpy.ndarray: The sorted and merged coordinates.
+    """
+    if extra_coordinates.size == 0:
+        return coordinates
+
+    tolerance = (
+        _RELATIVE_COORDINATE_TOLERANCE
+        * (coordinates[-1] - coordinates[0])
+        / max(coordinates.size - 1, 1)
+    )
+    merged_coordinates = numpy.concatenate((coordinates, extra_coordinates))
+    merged_coordinates.sort()
+    is_unique = numpy.empty(merged_coordinates.size, dtype=bool)
+    is_unique[0] = True
+    numpy.greater(numpy.diff(merged_coordinates), tolerance, out=is_unique[1:])
+    return merged_coordinates[is_unique]
+
 
 class RevetmentZoneSpecification(BaseModel):
     top_layer_specification: TopLayerSpecification
@@ -152,5 +260,5 @@ class RevetmentZoneSpecification(BaseModel):
                 top_layer_specification=self.top_layer_specification,
                 calculation_settings=self.calculation_settings,
             )
-            for x_location in x_output_locations
+            for x_location in x_output_locations.tolist()
         ]
@@ -95,6 +95,25 @@ def test_asphalt_zone_creates_locations():
     )
 
 
+def test_zone_locations_share_top_layer_specification():
+    zone_definition = HorizontalRevetmentZoneDefinition(x_min=1.0, x_max=6.0, nx=6)
+    top_layer = AsphaltLayerSpecification(
+        top_layer_type=TopLayerType.Asphalt,
+        flexural_strength=1.0,
+        soil_elasticity=2.0,
+        upper_layer_thickness=33.0,
+        upper_layer_elasticity_modulus=4.0,
+    )
+    zone = RevetmentZoneSpecification(
+        zone_definition=zone_definition, top_layer_specification=top_layer
+    )
+    locations = zone.get_output_locations(None)
+    assert all(
+        location.top_layer_specification is zone.top_layer_specification
+        for location in locations
+    )
+
+
 def test_horizontal_zone_definition_creates_coordinates_with_dx():
     zone = HorizontalRevetmentZoneDefinition(x_min=4.0, x_max=10.0, dx_max=2.0)
     x_coordinates = zone.get_x_coordinates(None)
@@ -145,6 +164,36 @@ def test_horizontal_zone_includes_profile_points():
     assert x_coordinates[4] == 7.0
 
 
+def test_horizontal_zone_does_not_duplicate_profile_points():
+    zone = HorizontalRevetmentZoneDefinition(x_min=4.0, x_max=7.0, nx=4)
+    zone.include_schematization_coordinates = True
+    dike_schem = DikeSchematization(
+        dike_orientation=0.0,
+        x_positions=[0.0, 5.0, 5.5, 6.0 + 1e-12, 10.0],
+        z_positions=[-5.0, -1.0, 0.0, 1.0, 5.0],
+        roughnesses=[1.0, 1.0, 1.0, 1.0],
+        x_outer_toe=0.0,
+        x_outer_crest=10.0,
+    )
+    x_coordinates = zone.get_x_coordinates(dike_schem)
+    assert list(x_coordinates) == [4.0, 5.0, 5.5, 6.0, 7.0]
+
+
+def test_horizontal_zone_does_not_duplicate_coinciding_profile_points():
+    zone = HorizontalRevetmentZoneDefinition(x_min=4.0, x_max=7.0, nx=4)
+    zone.include_schematization_coordinates = True
+    dike_schem = DikeSchematization(
+        dike_orientation=0.0,
+        x_positions=[0.0, 5.5, 5.5, 10.0],
+        z_positions=[-5.0, -1.0, 0.0, 5.0],
+        roughnesses=[1.0, 1.0, 1.0],
+        x_outer_toe=0.0,
+        x_outer_crest=10.0,
+    )
+    x_coordinates = zone.get_x_coordinates(dike_schem)
+    assert list(x_coordinates) == [4.0, 5.0, 5.5, 6.0, 7.0]
+
+
 def test_horizontal_zone_excludes_profile_points():
     zone = HorizontalRevetmentZoneDefinition(x_min=4.0, x_max=7.0, nx=4)
     zone.include_schematization_coordinates = False
@@ -164,6 +213,24 @@ def test_horizontal_zone_excludes_profile_points():
     assert x_coordinates[3] == 7.0
 
 
+def test_horizontal_zone_includes_profile_points_until_changed():
+    zone = HorizontalRevetmentZoneDefinition(
+        x_min=4.0, x_max=7.0, nx=4, include_schematization_coordinates=True
+    )
+    dike_schem = DikeSchematization(
+        dike_orientation=0.0,
+        x_positions=[0.0, 5.5, 10.0],
+        z_positions=[-5.0, 0.0, 5.0],
+        roughnesses=[1.0, 1.0],
+        x_outer_toe=0.0,
+        x_outer_crest=10.0,
+    )
+    assert list(zone.get_x_coordinates(dike_schem)) == [4.0, 5.0, 5.5, 6.0, 7.0]
+
+    zone.include_schematization_coordinates = False
+    assert list(zone.get_x_coordinates(dike_schem)) == [4.0, 5.0, 6.0, 7.0]
+
+
 def test_horizontal_zone_definition_throws_on_wrong_nz():
     with pytest.raises(ValidationError) as v_error:
         o = HorizontalRevetmentZoneDefinition(x_min=0.2, x_max=5.0, nx=-1)
@@ -251,6 +318,34 @@ def test_vertical_zone_definition_creates_coordinates_with_dz_inner_slope():
     assert x_coordinates[2] == 7.0
 
 
+def test_vertical_zone_definition_creates_coordinates_on_inner_slope():
+    zone = VerticalRevetmentZoneDefinition(z_min=-1.0, z_max=3.0, nz=3)
+    dike_schem = DikeSchematization(
+        dike_orientation=0.0,
+        x_positions=[0.0, 10.0, 15.0],
+        z_positions=[-5.0, 5.0, -3.0],
+        roughnesses=[1.0, 1.0],
+        x_outer_toe=0.0,
+        x_outer_crest=10.0,
+    )
+    x_coordinates = zone.get_x_coordinates(dike_schem, inner_slope=True)
+    assert list(x_coordinates) == [11.25, 12.5, 13.75]
+
+
+def test_vertical_zone_definition_creates_coordinates_on_inner_slope_after_crest():
+    zone = VerticalRevetmentZoneDefinition(z_min=-3.0, z_max=5.0, nz=5)
+    dike_schem = DikeSchematization(
+        dike_orientation=0.0,
+        x_positions=[0.0, 10.0, 12.0, 20.0],
+        z_positions=[-5.0, 5.0, 5.0, -3.0],
+        roughnesses=[1.0, 1.0, 1.0],
+        x_outer_toe=0.0,
+        x_outer_crest=10.0,
+    )
+    x_coordinates = zone.get_x_coordinates(dike_schem, inner_slope=True)
+    assert list(x_coordinates) == [12.0, 14.0, 16.0, 18.0, 20.0]
+
+
 def test_vertical_zone_includes_profile_points():
     zone = VerticalRevetmentZoneDefinition(z_min=4.0, z_max=7.0, nz=4)
     zone.include_schematization_coordinates = True
@@ -271,6 +366,21 @@ def test_vertical_zone_includes_profile_points():
     assert x_coordinates[4] == 7.0
 
 
+def test_vertical_zone_does_not_duplicate_profile_points():
+    zone = VerticalRevetmentZoneDefinition(z_min=4.0, z_max=7.0, nz=4)
+    zone.include_schematization_coordinates = True
+    dike_schem = DikeSchematization(
+        dike_orientation=0.0,
+        x_positions=[0.0, 4.0, 5.5, 10.0],
+        z_positions=[0.0, 4.0, 5.5, 10.0],
+        roughnesses=[1.0, 1.0, 1.0],
+        x_outer_toe=0.0,
+        x_outer_crest=15.0,
+    )
+    x_coordinates = zone.get_x_coordinates(dike_schem)
+    assert list(x_coordinates) == [4.0, 5.0, 5.5, 6.0, 7.0]
+
+
 def test_vertical_zone_excludes_profile_points():
     zone = VerticalRevetmentZoneDefinition(z_min=4.0, z_max=7.0, nz=4)
     zone.include_schematization_coordinates = False